@@ -1,18 +1,34 @@
+import os
 import time
 import random
-from connect4 import minimax, get_valid_locations, get_next_open_row, set_piece, winning_move, create_board, PLAYER, AI
+from concurrent.futures import ProcessPoolExecutor
+from connect4 import (minimax, iterative_deepening, clear_transposition_table, get_valid_locations,
+                      get_next_open_row, set_piece, winning_move, create_board, PLAYER, AI)
 import matplotlib.pyplot as plt
 
-def benchmark_speed(board, max_depth):
+def benchmark_speed(board, max_depth, repeats=5, workers=1):
+    """
+    Time the AI's search on board at each depth up to max_depth.
+
+    Each depth is timed repeats times from an empty transposition table and the
+    fastest run is kept, since shallow searches take well under a millisecond and
+    a single run is mostly timer and scheduling noise. With workers > 1 the deepest
+    iteration of each search is split across processes (see parallel_minimax), to
+    compare against the serial timings on a multi-core machine.
+    """
     speeds = []
     
     for depth in range(1, max_depth + 1):
-        start_time = time.time()
-        col, _ = minimax(board, depth, -float('inf'), float('inf'), True)  # AI move
-        end_time = time.time()
-        
-        speeds.append(end_time - start_time)
-        print(f"Depth {depth}: {end_time - start_time:.4f} seconds")
+        best_ns = None
+        for _ in range(repeats):
+            clear_transposition_table()
+            start_time = time.perf_counter_ns()
+            iterative_deepening(board, depth, workers=workers)  # AI move
+            elapsed_ns = time.perf_counter_ns() - start_time
+            best_ns = elapsed_ns if best_ns is None else min(best_ns, elapsed_ns)
+
+        speeds.append(best_ns / 1e9)
+        print(f"Depth {depth}: {best_ns / 1e9:.6f} seconds")
 
     plt.plot(range(1, max_depth + 1), speeds, label="AI Speed", marker='o')
     plt.xlabel("Depth")
@@ -43,6 +59,9 @@ def play_game(depth, optimal_opponent=False):
     - -1 if Random player wins
     - 0 if draw
     """
+    # start every game from an empty table, so move times don't depend on what earlier
+    # games or benchmarks left behind in this process
+    clear_transposition_table()
     board = create_board()
     game_over = False
     turn = 'AI'
@@ -50,22 +69,22 @@ def play_game(depth, optimal_opponent=False):
     move_count = 0
     while not game_over:
         if turn == 'AI':
-            start_time = time.time()  
-            col, _ = minimax(board, depth, -float('inf'), float('inf'), True)
+            start_time = time.perf_counter_ns()
+            col, _ = iterative_deepening(board, depth)
             row = get_next_open_row(board, col)
-            set_piece(board, row, col, 'X')  
-            end_time = time.time()  
-            time_taken = end_time - start_time
+            set_piece(board, row, col, AI)  
+            end_time = time.perf_counter_ns()
+            time_taken = (end_time - start_time) / 1e9
             ai_move_times.append(time_taken)  # save AI move time
-            if winning_move(board, 'X'):
+            if winning_move(board, AI):
                 return 1, ai_move_times, move_count  
 
             turn = 'PLAYER'
 
         else:  # Random player's turn
             row, col = optimal_player_move(board) if optimal_opponent else random_player_move(board)
-            set_piece(board, row, col, 'O') 
-            if winning_move(board, 'O'):
+            set_piece(board, row, col, PLAYER) 
+            if winning_move(board, PLAYER):
                 return -1, ai_move_times, move_count
             turn = 'AI'
         move_count += 1
@@ -77,6 +96,8 @@ def benchmark_win_rate(depth, games=10, optimal_opponent=False):
     """
     Benchmark AI win rate against a random player and track AI move time.
 
+    Games are simulated in parallel, one process per CPU.
+
     Parameters:
     - depth: AI search depth.
     - games: Number of games to simulate.
@@ -87,11 +108,16 @@ def benchmark_win_rate(depth, games=10, optimal_opponent=False):
     results = {1: 0, -1: 0, 0: 0}  # 1 -> AI win, -1 -> Player win, 0 -> Draw
     all_ai_move_times = []  #  track all AI move times across games
 
-    for _ in range(games):
-        print("Simulating game %d/%d..." % (_ + 1, games))
-        result, ai_move_times, move_count = play_game(depth, optimal_opponent)  
+    workers = min(os.cpu_count() or 1, games)
+    print("Simulating %d games on %d processes..." % (games, workers))
+    # games are independent, so they run in parallel; each worker reseeds its RNG so
+    # forked workers don't all replay the same random opponent
+    with ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as executor:
+        game_results = list(executor.map(play_game, [depth] * games, [optimal_opponent] * games))
+
+    for i, (result, ai_move_times, move_count) in enumerate(game_results):
         results[result] += 1
-        print("Move count for game %d is %d" % (_+1, move_count))
+        print("Move count for game %d is %d" % (i + 1, move_count))
         all_ai_move_times.extend(ai_move_times)  # save timing data from game
 
     win_rate = (results[1] / games) * 100  # win rate percentage
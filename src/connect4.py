@@ -1,21 +1,116 @@
+import multiprocessing
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 
 ROWS, COLS = 6, 7
-PLAYER, AI = 'O', 'X'
-EMPTY = '_'
+EMPTY, PLAYER, AI = 0, 1, 2
+
+# how each piece is shown when printing the board
+SYMBOLS = {EMPTY: '_', PLAYER: 'O', AI: 'X'}
+
+# bitboard layout: each column takes 7 bits (6 playable cells + 1 sentinel bit on top),
+# bit (col * H1 + row) is set when that cell is occupied, row 0 being the bottom row
+H1 = ROWS + 1
 
 # opening book (column preferences, prefer the middle columns)
 OPENING_BOOK = [3, 2, 4, 1, 5, 0, 6]
 
-# transposition table, to store previously evaluated board states for optimization
-transposition_table = {}
+# order in which minimax tries the columns, center first
+MOVE_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+# MOVE_ORDER with a given column (the transposition table's best move) moved to the front
+MOVE_ORDER_FROM = [(col,) + tuple(c for c in MOVE_ORDER if c != col) for col in range(COLS)]
+
+# search depth used by the AI
+MAX_DEPTH = 7
+
+# score of a won game, above anything score_position can return; see win_score
+WIN_SCORE = 1_000_000
+
+# extra plies minimax may search past depth 0 while the side that just moved threatens
+# an immediate win
+QUIESCENCE_PLIES = 1
+
+# bit positions of the cells of every 4-cell window (horizontal, vertical and both diagonals)
+WINDOW_CELLS = [
+    tuple((c + i * dc) * H1 + r + i * dr for i in range(4))
+    for c in range(COLS) for r in range(ROWS) for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1))
+    if 0 <= c + 3 * dc < COLS and 0 <= r + 3 * dr < ROWS
+]
+
+# bit masks of the same windows
+WINDOW_MASKS = [sum(1 << bit for bit in cells) for cells in WINDOW_CELLS]
+
+# top cell of every column; a column is playable while its top cell is empty
+TOP_MASK = sum(1 << (c * H1 + ROWS - 1) for c in range(COLS))
+
+# every playable cell, i.e. the occupied cells of a full board
+FULL_BOARD = sum(1 << (c * H1 + r) for c in range(COLS) for r in range(ROWS))
+
+# bottom cell of every column
+BOTTOM_MASK = sum(1 << (c * H1) for c in range(COLS))
+
+# cells of the center column
+CENTER_MASK = sum(1 << ((COLS // 2) * H1 + r) for r in range(ROWS))
 
-def create_board() -> None:
-    """Create a new Connect 4 board"""
-    transposition_table.clear()
-    return [[EMPTY for _ in range(COLS)] for _ in range(ROWS)]
+# windows covering each cell, indexed by bit position, used to score moves incrementally
+WINDOWS_BY_CELL = [[m for m in WINDOW_MASKS if m >> bit & 1] for bit in range(COLS * H1)]
+
+# transposition table, to store previously evaluated board states for optimization;
+# a fixed number of slots indexed by the low bits of the position hash, each holding
+# (hash, value, depth, flag, best_column). It is kept for the whole run, so entries
+# carry over between the AI's turns, while its size stays bounded
+TT_SIZE = 1 << 20
+TT_MASK = TT_SIZE - 1
+transposition_table = [None] * TT_SIZE
+
+# transposition table flags: the stored value is exact, a lower bound or an upper bound
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Zobrist keys, ZOBRIST[piece][col][row] with piece 0 for AI and 1 for PLAYER (row 0 is the bottom row);
+# a board hash is the XOR of the keys of its pieces, seeded so hashes are reproducible between runs
+_zobrist_rng = random.Random(4100)
+ZOBRIST = [[[_zobrist_rng.getrandbits(64) for _ in range(ROWS)] for _ in range(COLS)] for _ in range(2)]
+# mixed into the key of positions where the player (minimizer) is to move
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+# the same keys with the columns reversed, giving the hash of the mirrored board
+ZOBRIST_MIRROR = [keys[::-1] for keys in ZOBRIST]
+
+def clear_transposition_table() -> None:
+    """Empty every slot of the transposition table."""
+    transposition_table[:] = [None] * TT_SIZE
+
+def create_board() -> list:
+    """Create a new Connect 4 board.
+
+    The board is stored as [bb_ai, bb_player, heights]: one bitboard per player
+    and the number of pieces in each column.
+    """
+    return [0, 0, [0] * COLS]
+
+def get_piece(board: list, row: int, col: int) -> int:
+    """Get the piece at row, col position (row 0 is the top row).
+
+    Args:
+    -  board (list): The current state of the board.
+    -  row (int): The row of the cell.
+    -  col (int): The column of the cell.
+
+    Returns:
+    -  int: The piece at that position (AI, PLAYER or EMPTY).
+    """
+    bit = 1 << (col * H1 + ROWS - 1 - row)
+    if board[0] & bit:
+        return AI
+    if board[1] & bit:
+        return PLAYER
+    return EMPTY
+
+def to_grid(board: list) -> list:
+    """Expand the bitboards into a 2D list of pieces, top row first."""
+    return [[get_piece(board, r, c) for c in range(COLS)] for r in range(ROWS)]
 
 def print_board(board: list) -> None:
     """Print the current state of the board.
@@ -23,8 +118,8 @@ def print_board(board: list) -> None:
     Args:
     -   board (list): The current state of the board.
     """
-    for row in board:
-        print(' '.join(row))
+    for row in to_grid(board):
+        print(' '.join(SYMBOLS[piece] for piece in row))
     print(' '.join(map(str, range(COLS))))
 
 def is_valid(board: list, col: int) -> bool:
@@ -37,7 +132,7 @@ def is_valid(board: list, col: int) -> bool:
     Returns:
     -  bool: True if the column is valid, False otherwise.
     """
-    return col >= 0 and col <= 6 and board[0][col] == EMPTY
+    return col >= 0 and col <= 6 and board[2][col] < ROWS
 
 def get_next_open_row(board: list , col: int) -> int:
     """Get the next open row in a column.
@@ -49,105 +144,174 @@ def get_next_open_row(board: list , col: int) -> int:
     Returns:
     -  int: The row number of the topmost empty position in the column.
     """
-    for row in range(ROWS - 1, -1, -1):
-        if board[row][col] == EMPTY:
-            return row
+    if board[2][col] < ROWS:
+        return ROWS - 1 - board[2][col]
 
-def set_piece(board: list, row: list, col:list, piece:str) -> None:
+def set_piece(board: list, row: int, col: int, piece: int) -> None:
     """Places given piece on the board at row, col position.
 
+    The row must be the next open row of the column (see get_next_open_row).
+
     Args:
     -  board (list): The current state of the board.
     -  row (int): The row to place the piece in.
     -  col (int): The column to place the piece in.
-    -  piece (str): The piece to place ('X' or 'O').
+    -  piece (int): The piece to place (AI or PLAYER).
     """
-    board[row][col] = piece
+    bit = 1 << (col * H1 + ROWS - 1 - row)
+    if piece == AI:
+        board[0] |= bit
+    else:
+        board[1] |= bit
+    board[2][col] += 1
 
 def winning_move(board, piece):
-    """Check if the last move was a winning move."""
-    for c in range(COLS - 3):
-        for r in range(ROWS):
-            if all(board[r][c + i] == piece for i in range(4)):
-                return True
-
-    for c in range(COLS):
-        for r in range(ROWS - 3):
-            if all(board[r + i][c] == piece for i in range(4)):
-                return True
+    """Check if the given piece has four in a row on the board."""
+    return winning_move_bb(board[0] if piece == AI else board[1])
 
-    for c in range(COLS - 3):
-        for r in range(ROWS - 3):
-            if all(board[r + i][c + i] == piece for i in range(4)):
-                return True
+def winning_move_bb(bb: int) -> bool:
+    """Check a single bitboard for four in a row.
 
-    for c in range(COLS - 3):
-        for r in range(3, ROWS):
-            if all(board[r - i][c + i] == piece for i in range(4)):
-                return True
-
-    return False
+    Shifting by 1 pairs each cell with its neighbour in the same column, by H1 with the
+    next column, and by H1 - 1 / H1 + 1 along the diagonals; AND-ing a pair map with
+    itself shifted twice as far leaves a bit set only where four cells line up.
+    """
+    m = bb & (bb >> H1)  # horizontal
+    if m & (m >> (2 * H1)):
+        return True
+    m = bb & (bb >> 1)  # vertical
+    if m & (m >> 2):
+        return True
+    m = bb & (bb >> (H1 - 1))  # diagonal \
+    if m & (m >> (2 * (H1 - 1))):
+        return True
+    m = bb & (bb >> (H1 + 1))  # diagonal /
+    return bool(m & (m >> (2 * (H1 + 1))))
 
 def is_terminal(board):
     """Check if the game is over (win or draw)."""
-    return winning_move(board, PLAYER) or winning_move(board, AI) or len(get_valid_locations(board)) == 0
+    return classify(board[0], board[1])[0]
+
+def classify(bb_ai: int, bb_player: int) -> tuple:
+    """Check whether the game is over and who won, with one win check per side.
+
+    Returns:
+    -  tuple: (terminal, winner) where winner is AI, PLAYER or None for a draw or a game
+       still in progress.
+    """
+    if winning_move_bb(bb_ai):
+        return True, AI
+    if winning_move_bb(bb_player):
+        return True, PLAYER
+    return (bb_ai | bb_player) == FULL_BOARD, None
+
+def winning_cells(bb: int) -> int:
+    """Get the cells where a piece would complete four in a row for the given bitboard.
+
+    Same shifts as winning_move_bb, looking for three aligned pieces and taking the
+    fourth cell of the line (at either end or in the middle). Only the given bitboard is
+    looked at, so the result can include cells the other side already occupies; callers
+    must intersect it with the empty or playable cells.
+    """
+    cells = (bb << 1) & (bb << 2) & (bb << 3)  # vertical, only upwards
+    for shift in (H1, H1 - 1, H1 + 1):  # horizontal and both diagonals
+        pair = (bb << shift) & (bb << (2 * shift))
+        cells |= pair & (bb << (3 * shift))
+        cells |= pair & (bb >> shift)
+        pair = (bb >> shift) & (bb >> (2 * shift))
+        cells |= pair & (bb << shift)
+        cells |= pair & (bb >> (3 * shift))
+    return cells & FULL_BOARD
+
+def playable_cells(occupied: int) -> int:
+    """Get the cells the next piece can drop into, given the occupied cells."""
+    return (occupied + BOTTOM_MASK) & FULL_BOARD
+
+def valid_mask(occupied: int) -> int:
+    """Get the top cells of the columns that are not full, given the occupied cells."""
+    return ~occupied & TOP_MASK
 
 def get_valid_locations(board):
     """Get a list of valid columns for the next move."""
-    return [col for col in range(COLS) if is_valid(board, col)]
+    m = valid_mask(board[0] | board[1])
+    valid_locations = []
+    while m:
+        valid_locations.append(((m & -m).bit_length() - 1) // H1)  # lowest set bit -> column
+        m &= m - 1
+    return valid_locations
 
 def evaluation(window, piece):
     """Evaluate a window of 4 cells for scoring"""
-    score = 0
     opp_piece = PLAYER if piece == AI else AI
+    return SCORE_TABLE[window.count(piece) * 5 + window.count(opp_piece)]
 
-    if window.count(piece) == 4:
-        score += 100
-    elif window.count(piece) == 3 and window.count(EMPTY) == 1:
-        score += 10
-    elif window.count(piece) == 2 and window.count(EMPTY) == 2:
-        score += 4
+def score_position(board, piece):
+    """"Score the board from the perspective of the given piece."""
+    own, opp = (board[0], board[1]) if piece == AI else (board[1], board[0])
 
-    if window.count(opp_piece) == 3 and window.count(EMPTY) == 1:
-        score -= 8
+    score = (own & CENTER_MASK).bit_count() * 6
+
+    # popcounts of each window mask give the piece counts directly
+    for mask in WINDOW_MASKS:
+        score += SCORE_TABLE[(own & mask).bit_count() * 5 + (opp & mask).bit_count()]
 
     return score
 
-def score_position(board, piece):
-    """"Score the board from the perspective of the given piece."""
+def window_score(own_count: int, opp_count: int) -> int:
+    """Score a window given how many pieces the scoring side and its opponent have in it.
+
+    Only used to fill SCORE_TABLE, which the evaluation code looks scores up in.
+    """
+    empty_count = 4 - own_count - opp_count
     score = 0
 
-    center_array = [board[i][COLS // 2] for i in range(ROWS)]
-    center_count = center_array.count(piece)
-    score += center_count * 6
+    if own_count == 4:
+        score += 100
+    elif own_count == 3 and empty_count == 1:
+        score += 10
+    elif own_count == 2 and empty_count == 2:
+        score += 4
+
+    if opp_count == 3 and empty_count == 1:
+        score -= 8
 
-    for r in range(ROWS):
-        row_array = [board[r][c] for c in range(COLS)]
-        for c in range(COLS - 3):
-            window = row_array[c:c + 4]
-            score += evaluation(window, piece)
+    return score
 
-    for c in range(COLS):
-        col_array = [board[r][c] for r in range(ROWS)]
-        for r in range(ROWS - 3):
-            window = col_array[r:r + 4]
-            score += evaluation(window, piece)
+# window_score for every possible (own_count, opp_count), indexed by own_count * 5 + opp_count
+SCORE_TABLE = [window_score(p, q) if p + q <= 4 else 0 for p in range(5) for q in range(5)]
 
-    for r in range(ROWS - 3):
-        for c in range(COLS - 3):
-            window = [board[r + i][c + i] for i in range(4)]
-            score += evaluation(window, piece)
+def move_delta(bb_ai: int, bb_player: int, bit: int, piece: int) -> int:
+    """Change in score_position(board, AI) caused by playing piece at the given bit position.
 
-    for r in range(ROWS - 3):
-        for c in range(COLS - 3):
-            window = [board[r + 3 - i][c + i] for i in range(4)]
-            score += evaluation(window, piece)
+    Only the windows covering that cell (at most 13) are rescored.
+    """
+    delta = 6 if piece == AI and bit // H1 == COLS // 2 else 0
+    step = 5 if piece == AI else 1  # moves the SCORE_TABLE index to one more piece of that side
+    for mask in WINDOWS_BY_CELL[bit]:
+        i = (bb_ai & mask).bit_count() * 5 + (bb_player & mask).bit_count()
+        delta += SCORE_TABLE[i + step] - SCORE_TABLE[i]
+    return delta
+
+def win_score(occupied: int) -> int:
+    """Score of a game won with the given cells occupied, for the winner.
+
+    Wins that leave more of the board empty score higher, so the AI goes for the
+    quickest win and puts off a loss for as long as it can.
+    """
+    return WIN_SCORE + ROWS * COLS - occupied.bit_count()
 
-    return score
+def hash_board(board, mirrored=False):
+    """Generate the Zobrist hash of the current board state to save in transition table.
 
-def hash_board(board, depth):
-    """Generate a hash for the current board state and depth to save in transition table."""
-    return ''.join([''.join(row) for row in board]) + str(depth)
+    With mirrored=True, hash the board reflected left to right instead.
+    """
+    keys = ZOBRIST_MIRROR if mirrored else ZOBRIST
+    h = 0
+    for col in range(COLS):
+        for row in range(board[2][col]):
+            bit = 1 << (col * H1 + row)
+            h ^= keys[0 if board[0] & bit else 1][col][row]
+    return h
 
 def minimax(board:list, depth:int, alpha:float, beta:float, maximizingPlayer:bool) -> tuple:
     """ Minimax algorithm with alpha-beta pruning to determine the optimal move.
@@ -157,7 +321,7 @@ def minimax(board:list, depth:int, alpha:float, beta:float, maximizingPlayer:boo
     the AI and the human player play optimally.
 
     Args:
-    - board: The current game state, represented as a 2D list.
+    - board: The current game state, represented as [bb_ai, bb_player, heights].
     - depth: The maximum depth to explore in the game tree (limits recursion for efficiency).
     - alpha: The best value that the maximizer (AI) currently can guarantee.
     - beta: The best value that the minimizer (human player) currently can guarantee.
@@ -167,7 +331,7 @@ def minimax(board:list, depth:int, alpha:float, beta:float, maximizingPlayer:boo
     - tuple: (best_column, score)
         - best_column: The column index (0-6) of the best move found at this node.
         - score: The score associated with this move (high positive for good AI positions,
-                 high negative for good player positions).
+                 high negative for good player positions, +/- win_score(...) for forced wins).
 
     Algorithm Explanation:
     - If the current board state is already terminal (win/loss/draw) or if depth == 0:
@@ -191,6 +355,11 @@ def minimax(board:list, depth:int, alpha:float, beta:float, maximizingPlayer:boo
     - Uses a transposition table (board state hashing) to cache evaluated positions
       and avoid redundant calculations.
     - Prefers center column moves (strategy: control the center for higher chances of winning).
+    - Searches on the raw bitboards with in-place moves (see _search), so the recursion
+      allocates no boards.
+    - Positions reached at depth 0 where the side that just moved threatens to win with
+      its next piece are searched further, up to QUIESCENCE_PLIES extra plies, so the
+      evaluation does not stop just short of a forced win or loss.
 
     Notes:
     - Higher depth increases AI strength but slows down decision-making.
@@ -198,67 +367,269 @@ def minimax(board:list, depth:int, alpha:float, beta:float, maximizingPlayer:boo
       speeding up the decision process.
     """
 
-    board_hash = hash_board(board, depth)
-    if board_hash in transposition_table:
-        return transposition_table[board_hash]
-
-    valid_locations = get_valid_locations(board)
-    valid_locations.sort(key=lambda c: abs(COLS // 2 - c))  # Center-first move ordering
-    terminal_pos = is_terminal(board)
-
-    if depth == 0 or terminal_pos:
-        if terminal_pos:
-            if winning_move(board, AI):
-                return (None, float('inf'))
-            elif winning_move(board, PLAYER):
-                return (None, -float('inf'))
+    terminal, winner = classify(board[0], board[1])
+    if terminal:
+        if winner == AI:
+            return (None, win_score(board[0] | board[1]))
+        elif winner == PLAYER:
+            return (None, -win_score(board[0] | board[1]))
+        return (None, 0)
+
+    score = score_position(board, AI)
+    return _search(board[0], board[1], board[2][:], hash_board(board), hash_board(board, mirrored=True),
+                   score, depth, alpha, beta, maximizingPlayer)
+
+def _search(bb_ai: int, bb_player: int, heights: list, key: int, mirror_key: int, score: int, depth: int,
+            alpha: float, beta: float, maximizing: bool, extensions: int = QUIESCENCE_PLIES) -> tuple:
+    """Search kernel behind minimax, working directly on the two bitboards.
+
+    Pieces are played by OR-ing a single bit into the mover's bitboard and bumping
+    the column height, which is restored once the child has been searched, so no
+    board is copied per node. key and mirror_key are the Zobrist hashes of the
+    position and of its mirror image, and score is score_position(board, AI), all
+    updated incrementally as moves are made.
+
+    Values are stored in the transposition table with the depth they were searched
+    to and whether alpha-beta made them exact, a lower bound or an upper bound, so
+    they can be reused by any search needing the same or a shallower depth. A position
+    and its mirror image share one entry, stored under the smaller of the two hashes
+    with the best column given for that orientation. extensions is how many plies can
+    still be added past depth 0 while an immediate win is on the board.
+    """
+    side = 0 if maximizing else ZOBRIST_SIDE
+    mirrored = mirror_key < key
+    tt_key = (mirror_key if mirrored else key) ^ side
+    entry = transposition_table[tt_key & TT_MASK]
+    order = MOVE_ORDER
+    alpha_orig, beta_orig = alpha, beta
+    if entry is not None and entry[0] == tt_key:
+        _, tt_value, tt_depth, tt_flag, tt_column = entry
+        if mirrored:
+            tt_column = COLS - 1 - tt_column
+        if tt_depth >= depth:
+            # searched at least as deep already: reuse the value, or tighten the window with it
+            if tt_flag == EXACT:
+                return tt_column, tt_value
+            elif tt_flag == LOWER_BOUND:
+                alpha = max(alpha, tt_value)
             else:
-                return (None, 0)
-        else:
-            return (None, score_position(board, AI))
-
-    if maximizingPlayer:
+                beta = min(beta, tt_value)
+            if alpha >= beta:
+                return tt_column, tt_value
+        # best move found by an earlier search goes first
+        order = MOVE_ORDER_FROM[tt_column]
+
+    # won positions never get here: minimax handles them at the root and the move loops
+    # below stop at a winning move instead of recursing into it, so only draws are left
+    if (bb_ai | bb_player) == FULL_BOARD:
+        return (None, 0)
+    extended = False
+    if depth == 0:
+        # the side to move winning right away is found by the move loop anyway, so only
+        # extend when the other side threatens to win and the mover has to answer it
+        threats = winning_cells(bb_player if maximizing else bb_ai) & playable_cells(bb_ai | bb_player)
+        if not extensions or not threats:
+            return (None, score)
+        # look one ply further instead of trusting the score
+        depth, extensions, extended = 1, extensions - 1, True
+
+    # principal variation search: the first move (TT move or most central) is searched with
+    # the full window, the others with a null window that only proves they are no better,
+    # and are searched again with the full window when they turn out to be
+    column = None
+    if maximizing:
         value = -float('inf')
-        column = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [r[:] for r in board]
-            set_piece(temp_board, row, col, AI)
-            new_score = minimax(temp_board, depth - 1, alpha, beta, False)[1]
+        for col in order:
+            h = heights[col]
+            if h == ROWS:
+                continue
+            bit = col * H1 + h
+            child_ai = bb_ai | (1 << bit)
+            if winning_move_bb(child_ai):
+                # immediate win: nothing can beat it, so no need to recurse into it
+                value, column = win_score(child_ai | bb_player), col
+                break
+            child = (child_ai, bb_player, heights,
+                     key ^ ZOBRIST[0][col][h], mirror_key ^ ZOBRIST_MIRROR[0][col][h],
+                     score + move_delta(bb_ai, bb_player, bit, AI), depth - 1)
+            heights[col] = h + 1
+            if column is None or alpha == -float('inf'):
+                new_score = _search(*child, alpha, beta, False, extensions)[1]
+            else:
+                new_score = _search(*child, alpha, alpha + 1, False, extensions)[1]
+                if alpha < new_score < beta:
+                    new_score = _search(*child, alpha, beta, False, extensions)[1]
+            heights[col] = h
+            if column is None:
+                column = col  # deterministic tie-break: first valid column in the order
             if new_score > value:
                 value = new_score
                 column = col
             alpha = max(alpha, value)
             if alpha >= beta:
                 break
-        transposition_table[board_hash] = (column, value)
-        return column, value
 
     else:
         value = float('inf')
-        column = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [r[:] for r in board]
-            set_piece(temp_board, row, col, PLAYER)
-            new_score = minimax(temp_board, depth - 1, alpha, beta, True)[1]
+        for col in order:
+            h = heights[col]
+            if h == ROWS:
+                continue
+            bit = col * H1 + h
+            child_player = bb_player | (1 << bit)
+            if winning_move_bb(child_player):
+                value, column = -win_score(bb_ai | child_player), col
+                break
+            child = (bb_ai, child_player, heights,
+                     key ^ ZOBRIST[1][col][h], mirror_key ^ ZOBRIST_MIRROR[1][col][h],
+                     score + move_delta(bb_ai, bb_player, bit, PLAYER), depth - 1)
+            heights[col] = h + 1
+            if column is None or beta == float('inf'):
+                new_score = _search(*child, alpha, beta, True, extensions)[1]
+            else:
+                new_score = _search(*child, beta - 1, beta, True, extensions)[1]
+                if alpha < new_score < beta:
+                    new_score = _search(*child, alpha, beta, True, extensions)[1]
+            heights[col] = h
+            if column is None:
+                column = col
             if new_score < value:
                 value = new_score
                 column = col
             beta = min(beta, value)
             if alpha >= beta:
                 break
-        transposition_table[board_hash] = (column, value)
+
+    if extended:
+        # searched with less extension budget than a real depth-1 node would have, so
+        # storing it as depth 1 would let it stand in for a deeper search than it was
+        return column, value
+
+    if value <= alpha_orig:
+        flag = UPPER_BOUND
+    elif value >= beta_orig:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    # replacement policy: keep whichever of the two positions was searched deeper
+    slot = tt_key & TT_MASK
+    entry = transposition_table[slot]
+    if entry is None or entry[0] == tt_key or depth >= entry[2]:
+        stored_column = COLS - 1 - column if mirrored else column
+        transposition_table[slot] = (tt_key, value, depth, flag, stored_column)
+    return column, value
+
+# best root score found so far by parallel_minimax, shared with its worker processes
+_shared_alpha = None
+
+def _init_root_worker(shared_alpha) -> None:
+    """Initializer for parallel_minimax's worker processes."""
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+def _search_root_move(bb_ai: int, bb_player: int, heights: list, col: int, depth: int) -> int:
+    """Worker for parallel_minimax: score the AI playing col at the root.
+
+    The move only matters if it beats the best score found so far by any worker, so it
+    is first searched with a null window against that bound and only searched again
+    with the full window if it beats it. A better score is published for the other
+    workers to search against.
+
+    Returns:
+    - int: The move's exact score, or None if it does not beat the bound.
+    """
+    board = [bb_ai, bb_player, heights]
+    set_piece(board, get_next_open_row(board, col), col, AI)
+    alpha = _shared_alpha.value
+    value = minimax(board, depth - 1, alpha, alpha + 1, False)[1]
+    if value <= alpha:
+        return None
+    value = minimax(board, depth - 1, alpha, float('inf'), False)[1]
+    with _shared_alpha.get_lock():
+        if value > _shared_alpha.value:
+            _shared_alpha.value = value
+    return value
+
+def parallel_minimax(board: list, depth: int, first: int = None, workers: int = None) -> tuple:
+    """Minimax for the AI with the root moves searched in parallel processes.
+
+    The first move (first if given, else the most central valid column) is searched
+    here to get a bound, then the remaining root moves are searched in a process pool
+    against the best score found so far, shared between the workers, in the spirit of
+    Young Brothers Wait. Each worker starts from a copy of this process's transposition
+    table where the platform forks, but what the workers learn is not shared back.
+
+    Args:
+    - board: The current game state.
+    - depth: The depth to search to.
+    - first: The column to search first, typically the best move of a shallower search.
+    - workers: The number of processes, defaults to the number of CPUs.
+
+    Returns:
+    - tuple: (best_column, score), the same score minimax(board, depth, ...) gives for the AI.
+    """
+    if classify(board[0], board[1])[0]:
+        return minimax(board, depth, -float('inf'), float('inf'), True)  # (None, final score)
+
+    moves = [col for col in MOVE_ORDER if is_valid(board, col)]
+    if first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+
+    column = moves[0]
+    child = [board[0], board[1], board[2][:]]
+    set_piece(child, get_next_open_row(child, column), column, AI)
+    value = minimax(child, depth - 1, -float('inf'), float('inf'), False)[1]
+    if value >= WIN_SCORE or len(moves) == 1:
         return column, value
 
+    # scores are finite ints (see win_score), so the bound fits a shared 64-bit int
+    shared_alpha = multiprocessing.Value('q', value)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_root_worker,
+                             initargs=(shared_alpha,)) as executor:
+        futures = [executor.submit(_search_root_move, board[0], board[1], board[2][:], col, depth)
+                   for col in moves[1:]]
+        for col, future in zip(moves[1:], futures):
+            new_score = future.result()
+            if new_score is not None and new_score > value:
+                value = new_score
+                column = col
+    return column, value
+
+def iterative_deepening(board: list, max_depth: int, workers: int = 1) -> tuple:
+    """Run minimax for the AI at depth 1, 2, ... up to max_depth.
+
+    Each iteration leaves its best moves in the transposition table, where the next,
+    deeper iteration picks them up to try first, which makes alpha-beta prune a lot more.
+
+    Args:
+    - board: The current game state.
+    - max_depth: The deepest search to run.
+    - workers: With more than 1, the deepest iteration is split across that many
+      processes with parallel_minimax, which pays off when searches are deep enough
+      to outweigh starting the processes.
+
+    Returns:
+    - tuple: (best_column, score) from the deepest completed search.
+    """
+    column = None
+    for depth in range(1, max_depth + 1):
+        if workers > 1 and depth == max_depth:
+            column, value = parallel_minimax(board, depth, first=column, workers=workers)
+        else:
+            column, value = minimax(board, depth, -float('inf'), float('inf'), True)
+        if abs(value) >= WIN_SCORE:
+            break  # the game is decided, searching deeper will not change the outcome
+    return column, value
+
 def get_ai_move(board):
-    if sum(row.count(AI) + row.count(PLAYER) for row in board) < 2:
+    if sum(board[2]) < 2:
         for col in OPENING_BOOK:
             if is_valid(board, col):
                 return col
 
     start = time.time()
-    col, _ = minimax(board, 7, -float('inf'), float('inf'), True)
+    col, _ = iterative_deepening(board, MAX_DEPTH)
     end = time.time()
     print(f"AI move calculated in {end - start:.4f} seconds")
     return col
@@ -267,7 +638,7 @@ def play_game():
     board = create_board()
     game_over = False
     print("\nWelcome to Connect 4!")
-    print("You are 'O' and the AI is 'X'.")
+    print(f"You are '{SYMBOLS[PLAYER]}' and the AI is '{SYMBOLS[AI]}'.")
     print("The board columns are numbered from 0 to 6.\n")
 
     print_board(board)